@@ -4,22 +4,84 @@ Audio processing utilities for preparing audio files for transcription.
 
 import os
 import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import logging
 
 import numpy as np
+import soundfile as sf
+import soxr
 from pydub import AudioSegment
 from pydub.exceptions import CouldntDecodeError
 
+# Chunked-resample tuning: chunk length per worker, and the overlap kept
+# on each side so the soxr filter sees continuous signal at the seams
+_CHUNK_SECONDS = 30
+_OVERLAP_SAMPLES = 2048
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; NumPy fallback below
+    njit = None
+    prange = range
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _normalize_int16(samples: np.ndarray, target_dbfs: float) -> Tuple[np.ndarray, float]:
+        """Fused RMS + gain + clip kernel: one pass, no temporaries."""
+        total = 0.0
+        for i in prange(samples.size):
+            value = np.float32(samples[i])
+            total += value * value
+
+        rms = np.sqrt(total / samples.size) + 1e-9
+        current_dbfs = 20.0 * np.log10(rms / 32768.0)
+        gain = 10.0 ** ((target_dbfs - current_dbfs) / 20.0)
+
+        out = np.empty(samples.size, dtype=np.int16)
+        for i in prange(samples.size):
+            value = samples[i] * gain
+            if value > 32767.0:
+                value = 32767.0
+            elif value < -32768.0:
+                value = -32768.0
+            out[i] = np.int16(value)
+
+        return out, current_dbfs
+else:
+    _normalize_int16 = None
+
+
+@dataclass
+class RawAudio:
+    """Decoded PCM audio held as a NumPy array."""
+
+    data: np.ndarray  # int16 samples, shape (frames, channels)
+    sample_rate: int
+    channels: int
+
+
+def _i16_to_f32(samples: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Convert int16 PCM to float32 in [-1, 1] in a single fused pass."""
+    return np.multiply(samples, np.float32(1.0 / 32768.0), dtype=np.float32, out=out)
+
+
+def _process_file_worker(config: dict, audio_path: Path) -> Optional[np.ndarray]:
+    """Process one file in a worker process (module-level for pickling)."""
+    return AudioProcessor(config).process_audio_file(audio_path)
+
 
 class AudioProcessor:
     """Handles audio file preprocessing for optimal transcription."""
-    
+
     def __init__(self, config: dict):
         """
         Initialize AudioProcessor with configuration.
-        
+
         Args:
             config: Configuration dictionary containing audio settings
         """
@@ -27,130 +89,345 @@ class AudioProcessor:
         self.audio_config = config.get('audio', {})
         self.preprocessing_config = self.audio_config.get('preprocessing', {})
         self.logger = logging.getLogger('audio_transcriber')
-        
+
         # Audio processing parameters
         self.target_sample_rate = self.preprocessing_config.get('target_sample_rate', 16000)
         self.convert_to_mono = self.preprocessing_config.get('convert_to_mono', True)
         self.normalize = self.preprocessing_config.get('normalize', True)
-    
-    def process_audio_file(self, audio_path: Path) -> Optional[Path]:
+
+        # Hot-path constants resolved once per instance
+        self._max_size_bytes = int(self.audio_config.get('max_file_size_mb', 500)) * 1024 * 1024
+        self._debug = self.logger.isEnabledFor(logging.DEBUG)
+
+        # Per-thread pool of reusable sample buffers
+        self._pool = threading.local()
+
+    def process_audio_file(self, audio_path: Path) -> Optional[np.ndarray]:
         """
         Process an audio file for transcription.
-        
+
         Args:
             audio_path: Path to the input audio file
-            
+
         Returns:
-            Path to the processed audio file, or None if processing failed
+            Float32 mono samples in [-1, 1] at the target sample rate,
+            ready to be passed to Whisper, or None if processing failed
         """
         try:
-            self.logger.info(f"Processing audio file: {audio_path}")
-            
+            self.logger.info("Processing audio file: %s", audio_path)
+
+            # Fast path: input already in Whisper's native format
+            fast = self._try_fast_path(audio_path)
+            if fast is not None:
+                self.logger.info("Successfully processed: %s", audio_path)
+                return fast
+
             # Load audio file
-            audio = self._load_audio(audio_path)
-            if audio is None:
+            raw = self._load_audio(audio_path)
+            if raw is None:
                 return None
-            
+
             # Apply preprocessing
-            processed_audio = self._preprocess_audio(audio)
-            
-            # Save processed audio to temporary file
-            temp_file = self._save_processed_audio(processed_audio, audio_path)
-            
-            self.logger.info(f"Successfully processed: {audio_path}")
-            return temp_file
-            
+            samples = self._preprocess_audio(raw)
+
+            self.logger.info("Successfully processed: %s", audio_path)
+            return _i16_to_f32(samples, out=self._get_buf(samples.size, np.float32))
+
         except Exception as e:
-            self.logger.error(f"Error processing audio file {audio_path}: {e}")
+            self.logger.error("Error processing audio file %s: %s", audio_path, e)
             return None
-    
-    def _load_audio(self, audio_path: Path) -> Optional[AudioSegment]:
+
+    def process_batch(self, paths: List[Path]) -> Dict[Path, Optional[np.ndarray]]:
+        """
+        Process a batch of audio files across all CPU cores.
+
+        Uses a process pool so decode/resample work bypasses the GIL and
+        saturates the machine instead of running one file at a time.
+
+        Args:
+            paths: Audio file paths to process
+
+        Returns:
+            Mapping of input path to processed samples (None where a file
+            failed to process)
+        """
+        results: Dict[Path, Optional[np.ndarray]] = {}
+
+        if not paths:
+            return results
+
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {
+                executor.submit(_process_file_worker, self.config, path): path
+                for path in paths
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    results[path] = future.result()
+                except Exception as e:
+                    self.logger.error("Error processing audio file %s: %s", path, e)
+                    results[path] = None
+
+        return results
+
+    def _try_fast_path(self, audio_path: Path) -> Optional[np.ndarray]:
         """
-        Load audio file using pydub.
-        
+        Short-circuit files that already match the target format.
+
+        Recorders often emit 16 kHz mono PCM_16 WAV — exactly what Whisper
+        wants. Detect that from the header alone and skip the downmix and
+        resample stages, leaving only the optional normalize step.
+
         Args:
             audio_path: Path to the audio file
-            
+
         Returns:
-            AudioSegment object or None if loading failed
+            Float32 samples if the fast path applied, otherwise None
         """
         try:
-            # Check file size
-            file_size = audio_path.stat().st_size
-            max_size = self.audio_config.get('max_file_size_mb', 500) * 1024 * 1024
-            
-            if file_size > max_size:
-                self.logger.warning(f"File {audio_path} is too large ({file_size} bytes)")
+            if os.stat(audio_path).st_size > self._max_size_bytes:
                 return None
-            
-            # Load audio file
-            audio = AudioSegment.from_file(str(audio_path))
-            self.logger.debug(f"Loaded audio: {audio_path}, duration: {len(audio)/1000:.2f}s")
-            
-            return audio
-            
-        except CouldntDecodeError as e:
-            self.logger.error(f"Could not decode audio file {audio_path}: {e}")
+
+            info = sf.info(str(audio_path))
+            if (info.samplerate != self.target_sample_rate
+                    or info.channels != 1
+                    or info.subtype != 'PCM_16'):
+                return None
+
+            samples, _ = sf.read(str(audio_path), dtype='int16')
+        except Exception:
             return None
+
+        if self._debug:
+            self.logger.debug("Fast path: %s is already %sHz mono PCM_16",
+                              audio_path, self.target_sample_rate)
+
+        if self.normalize:
+            samples = self._normalize_audio(samples)
+
+        return _i16_to_f32(samples, out=self._get_buf(samples.size, np.float32))
+
+    def _get_buf(self, length: int, dtype) -> np.ndarray:
+        """
+        Return a reusable per-thread buffer of at least ``length`` samples.
+
+        Recycling buffers between files avoids re-allocating (and
+        page-faulting) tens of MB per call. A buffer handed out here is
+        only valid until the same thread's next request for that dtype.
+
+        Args:
+            length: Number of samples required
+            dtype: NumPy dtype of the buffer
+
+        Returns:
+            A length-sized view into the pooled buffer
+        """
+        pool = getattr(self._pool, 'buffers', None)
+        if pool is None:
+            pool = self._pool.buffers = {}
+
+        key = np.dtype(dtype)
+        buf = pool.get(key)
+        if buf is None or buf.size < length:
+            buf = np.empty(length, key)
+            pool[key] = buf
+
+        return buf[:length]
+
+    def _load_audio(self, audio_path: Path) -> Optional[RawAudio]:
+        """
+        Load audio file into a RawAudio buffer.
+
+        Decodes in-process via libsndfile (WAV/FLAC/OGG/AIFF); falls back
+        to pydub/ffmpeg for formats libsndfile cannot read (MP3, M4A).
+
+        Args:
+            audio_path: Path to the audio file
+
+        Returns:
+            RawAudio object or None if loading failed
+        """
+        try:
+            # Check file size (single stat; libsndfile opens by fd after this)
+            file_size = os.stat(audio_path).st_size
+
+            if file_size > self._max_size_bytes:
+                self.logger.warning("File %s is too large (%s bytes)", audio_path, file_size)
+                return None
+
+            # Decode in-process with libsndfile first (no ffmpeg subprocess)
+            try:
+                data, sample_rate = sf.read(str(audio_path), dtype='int16', always_2d=True)
+                raw = RawAudio(data=data, sample_rate=sample_rate, channels=data.shape[1])
+            except Exception:
+                raw = self._load_audio_pydub(audio_path)
+                if raw is None:
+                    return None
+
+            if self._debug:
+                self.logger.debug(
+                    "Loaded audio: %s, duration: %.2fs", audio_path, len(raw.data) / raw.sample_rate
+                )
+            return raw
+
         except Exception as e:
-            self.logger.error(f"Error loading audio file {audio_path}: {e}")
+            self.logger.error("Error loading audio file %s: %s", audio_path, e)
+            return None
+
+    def _load_audio_pydub(self, audio_path: Path) -> Optional[RawAudio]:
+        """
+        Fallback decode via pydub/ffmpeg for compressed formats.
+
+        Args:
+            audio_path: Path to the audio file
+
+        Returns:
+            RawAudio object or None if loading failed
+        """
+        try:
+            audio = AudioSegment.from_file(str(audio_path))
+
+            # Ensure 16-bit samples so the raw buffer can be viewed as int16
+            if audio.sample_width != 2:
+                audio = audio.set_sample_width(2)
+
+            data = np.frombuffer(audio.raw_data, dtype=np.int16).reshape(-1, audio.channels)
+            return RawAudio(data=data, sample_rate=audio.frame_rate, channels=audio.channels)
+
+        except CouldntDecodeError as e:
+            self.logger.error("Could not decode audio file %s: %s", audio_path, e)
             return None
-    
-    def _preprocess_audio(self, audio: AudioSegment) -> AudioSegment:
+
+    def _preprocess_audio(self, raw: RawAudio) -> np.ndarray:
         """
         Apply preprocessing to audio for optimal transcription.
-        
+
         Args:
-            audio: Input AudioSegment
-            
+            raw: Decoded input audio
+
         Returns:
-            Processed AudioSegment
-        """
-        # Convert to mono if requested
-        if self.convert_to_mono and audio.channels > 1:
-            audio = audio.set_channels(1)
-            self.logger.debug("Converted audio to mono")
-        
-        # Set sample rate
-        if audio.frame_rate != self.target_sample_rate:
-            audio = audio.set_frame_rate(self.target_sample_rate)
-            self.logger.debug(f"Set sample rate to {self.target_sample_rate}Hz")
-        
+            Processed int16 sample array (interleaved if multi-channel)
+        """
+        samples = raw.data
+
+        # Convert to mono if requested: promote to int32 so the channel sum
+        # cannot overflow, then average back down to int16 in one SIMD pass
+        if self.convert_to_mono and raw.channels > 1:
+            samples = (samples.astype(np.int32).sum(axis=1) // raw.channels).astype(np.int16)
+            samples = samples.reshape(-1, 1)
+            if self._debug:
+                self.logger.debug("Converted audio to mono")
+
+        # Resample in-process with soxr instead of shelling out to ffmpeg
+        if raw.sample_rate != self.target_sample_rate:
+            chunk_frames = _CHUNK_SECONDS * raw.sample_rate
+            if len(samples) > 2 * chunk_frames:
+                samples = self._resample_chunked(samples, raw.sample_rate, chunk_frames)
+            else:
+                f32_in = _i16_to_f32(
+                    samples,
+                    out=self._get_buf(samples.size, np.float32).reshape(samples.shape)
+                )
+                resampled = soxr.resample(
+                    f32_in,
+                    raw.sample_rate,
+                    self.target_sample_rate,
+                    quality='HQ'
+                )
+                samples = np.clip(resampled * 32768.0, -32768, 32767).astype(np.int16)
+            if self._debug:
+                self.logger.debug("Set sample rate to %sHz", self.target_sample_rate)
+
+        # Flatten to an interleaved 1-D buffer
+        samples = samples.reshape(-1)
+
         # Normalize audio levels
         if self.normalize:
-            audio = self._normalize_audio(audio)
-        
-        return audio
-    
-    def _normalize_audio(self, audio: AudioSegment) -> AudioSegment:
+            samples = self._normalize_audio(samples)
+
+        return samples
+
+    def _resample_chunked(self, samples: np.ndarray, src_rate: int, chunk_frames: int) -> np.ndarray:
+        """
+        Resample a long recording in parallel chunks.
+
+        Chunks carry an overlap on each side so the resampler filter sees
+        continuous signal at the seams; soxr releases the GIL, so the
+        per-chunk resamples run concurrently across threads.
+
+        Args:
+            samples: Input int16 sample array (frames x channels)
+            src_rate: Source sample rate
+            chunk_frames: Frames per chunk
+
+        Returns:
+            Resampled int16 sample array at the target rate
+        """
+        ratio = self.target_sample_rate / src_rate
+        total = len(samples)
+
+        def _resample_one(start: int) -> np.ndarray:
+            lo = max(0, start - _OVERLAP_SAMPLES)
+            hi = min(total, start + chunk_frames + _OVERLAP_SAMPLES)
+            out = soxr.resample(
+                _i16_to_f32(samples[lo:hi]),
+                src_rate,
+                self.target_sample_rate,
+                quality='HQ'
+            )
+            # Trim the resampled overlap back to this chunk's own span
+            head = int(round((start - lo) * ratio))
+            length = int(round(min(chunk_frames, total - start) * ratio))
+            return out[head:head + length]
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            pieces = list(executor.map(_resample_one, range(0, total, chunk_frames)))
+
+        resampled = np.concatenate(pieces)
+        return np.clip(resampled * 32768.0, -32768, 32767).astype(np.int16)
+
+    def _normalize_audio(self, samples: np.ndarray) -> np.ndarray:
         """
         Normalize audio levels to improve transcription quality.
-        
+
         Args:
-            audio: Input AudioSegment
-            
+            samples: Input int16 sample array
+
         Returns:
-            Normalized AudioSegment
+            Normalized int16 sample array
         """
         # Calculate target dBFS (decibels relative to full scale)
         target_dbfs = -20.0
-        
-        # Normalize to target dBFS
-        change_in_dbfs = target_dbfs - audio.dBFS
-        normalized_audio = audio.apply_gain(change_in_dbfs)
-        
-        self.logger.debug(f"Normalized audio from {audio.dBFS:.2f} dBFS to {normalized_audio.dBFS:.2f} dBFS")
-        
-        return normalized_audio
-    
-    def _save_processed_audio(self, audio: AudioSegment, original_path: Path) -> Path:
+
+        if _normalize_int16 is not None:
+            # Fused numba kernel: single parallel pass, no intermediate arrays
+            normalized, current_dbfs = _normalize_int16(samples, target_dbfs)
+        else:
+            # Compute RMS level in NumPy instead of pydub's per-sample Python path
+            rms = np.sqrt(np.mean(samples.astype(np.float32) ** 2)) + 1e-9
+            current_dbfs = 20 * np.log10(rms / 32768.0)
+
+            # Apply gain as a single vectorized multiply + clip
+            gain_linear = 10 ** ((target_dbfs - current_dbfs) / 20)
+            normalized = np.clip(samples.astype(np.float32) * gain_linear, -32768, 32767).astype(np.int16)
+
+        if self._debug:
+            self.logger.debug("Normalized audio from %.2f dBFS to %.2f dBFS", current_dbfs, target_dbfs)
+
+        return normalized
+
+    def _save_processed_audio(self, samples: np.ndarray, original_path: Path) -> Path:
         """
         Save processed audio to a temporary WAV file.
-        
+
+        Kept off the fast path (transcription consumes samples in-memory);
+        useful for debugging preprocessing output.
+
         Args:
-            audio: Processed AudioSegment
+            samples: Processed int16 sample array
             original_path: Original audio file path (for naming)
-            
+
         Returns:
             Path to the temporary processed audio file
         """
@@ -158,45 +435,71 @@ class AudioProcessor:
         temp_dir = tempfile.gettempdir()
         temp_filename = f"processed_{original_path.stem}.wav"
         temp_path = Path(temp_dir) / temp_filename
-        
+
         # Export as WAV (Whisper prefers WAV format)
-        audio.export(
-            str(temp_path),
-            format="wav",
-            parameters=["-ar", str(self.target_sample_rate)]
-        )
-        
-        self.logger.debug(f"Saved processed audio to: {temp_path}")
+        sf.write(str(temp_path), samples, self.target_sample_rate, subtype='PCM_16')
+
+        self.logger.debug("Saved processed audio to: %s", temp_path)
         return temp_path
-    
+
     def cleanup_temp_file(self, temp_path: Path) -> None:
         """
         Clean up temporary processed audio file.
-        
+
         Args:
             temp_path: Path to temporary file to delete
         """
         try:
             if temp_path.exists():
                 temp_path.unlink()
-                self.logger.debug(f"Cleaned up temporary file: {temp_path}")
+                self.logger.debug("Cleaned up temporary file: %s", temp_path)
         except Exception as e:
-            self.logger.warning(f"Could not clean up temporary file {temp_path}: {e}")
-    
+            self.logger.warning("Could not clean up temporary file %s: %s", temp_path, e)
+
     def get_audio_info(self, audio_path: Path) -> Optional[dict]:
         """
         Get information about an audio file.
-        
+
+        Reads only the file header via libsndfile; dBFS is estimated from
+        the first few seconds instead of decoding the whole file. Falls
+        back to a full pydub decode for formats libsndfile cannot read.
+
         Args:
             audio_path: Path to the audio file
-            
+
         Returns:
             Dictionary with audio information or None if failed
         """
+        try:
+            try:
+                info = sf.info(str(audio_path))
+            except Exception:
+                return self._get_audio_info_pydub(audio_path)
+
+            # Estimate dBFS on a short leading window (~5s) only
+            frames = int(min(info.frames, info.samplerate * 5))
+            window, _ = sf.read(str(audio_path), frames=frames, dtype='float32', always_2d=True)
+            rms = np.sqrt(np.mean(window ** 2)) + 1e-9
+
+            return {
+                'duration_seconds': info.frames / info.samplerate,
+                'sample_rate': info.samplerate,
+                'channels': info.channels,
+                'bit_depth': info.subtype_info,
+                'file_size_mb': audio_path.stat().st_size / (1024 * 1024),
+                'dbfs': float(20 * np.log10(rms))
+            }
+
+        except Exception as e:
+            self.logger.error("Error getting audio info for %s: %s", audio_path, e)
+            return None
+
+    def _get_audio_info_pydub(self, audio_path: Path) -> Optional[dict]:
+        """Fallback audio info via a full pydub/ffmpeg decode."""
         try:
             audio = AudioSegment.from_file(str(audio_path))
-            
-            info = {
+
+            return {
                 'duration_seconds': len(audio) / 1000.0,
                 'sample_rate': audio.frame_rate,
                 'channels': audio.channels,
@@ -204,9 +507,7 @@ class AudioProcessor:
                 'file_size_mb': audio_path.stat().st_size / (1024 * 1024),
                 'dbfs': audio.dBFS
             }
-            
-            return info
-            
+
         except Exception as e:
-            self.logger.error(f"Error getting audio info for {audio_path}: {e}")
-            return None 
\ No newline at end of file
+            self.logger.error("Error getting audio info for %s: %s", audio_path, e)
+            return None
@@ -2,16 +2,59 @@
 iCloud file management and synchronization utilities.
 """
 
+import os
 import shutil
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 import time
 
+from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
+from watchdog.events import FileSystemEventHandler
+
+
+def _scan_files(path):
+    """Yield os.DirEntry objects for every file under path, recursively.
+
+    DirEntry caches the type from the directory read, so this avoids the
+    extra stat per entry that Path.rglob + is_file incurs.
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_files(entry.path)
+            else:
+                yield entry
+
+
+class _FileSyncHandler(FileSystemEventHandler):
+    """Signals an event when a specific file is created or modified."""
+
+    def __init__(self, target_path: str, synced: threading.Event):
+        self.target_path = target_path
+        self.synced = synced
+
+    def on_created(self, event):
+        if event.src_path == self.target_path:
+            self.synced.set()
+
+    def on_modified(self, event):
+        if event.src_path == self.target_path:
+            self.synced.set()
+
 
 class CloudSync:
     """Handles iCloud file management and synchronization."""
-    
+
+    # Seconds a cached directory count stays valid. A directory's mtime
+    # only reflects its direct children, so changes deeper in the tree
+    # are picked up when the TTL lapses
+    _STATUS_CACHE_TTL = 30.0
+
+
     def __init__(self, config: dict):
         """
         Initialize CloudSync with configuration.
@@ -27,6 +70,9 @@ class CloudSync:
         self.base_path = Path(self.icloud_config.get('base_path', ''))
         self.audio_source = self.base_path / self.icloud_config.get('audio_source', 'Audio Files')
         self.transcript_dest = self.base_path / self.icloud_config.get('transcript_dest', 'Transcripts')
+
+        # Directory-count cache for get_icloud_status, keyed by dir mtime
+        self._status_cache = {}
     
     def ensure_directories_exist(self) -> bool:
         """
@@ -36,26 +82,21 @@ class CloudSync:
             True if directories are ready, False otherwise
         """
         try:
-            # Check if iCloud base path exists
+            # Check the iCloud base path once; never create it ourselves
             if not self.base_path.exists():
-                self.logger.error(f"iCloud base path does not exist: {self.base_path}")
+                self.logger.error("iCloud base path does not exist: %s", self.base_path)
                 self.logger.error("Please ensure iCloud Drive is enabled and synced")
                 return False
-            
-            # Create audio source directory if it doesn't exist
-            if not self.audio_source.exists():
-                self.audio_source.mkdir(parents=True, exist_ok=True)
-                self.logger.info(f"Created audio source directory: {self.audio_source}")
-            
-            # Create transcript destination directory if it doesn't exist
-            if not self.transcript_dest.exists():
-                self.transcript_dest.mkdir(parents=True, exist_ok=True)
-                self.logger.info(f"Created transcript destination directory: {self.transcript_dest}")
-            
+
+            # mkdir with exist_ok is a no-op when the directory is already
+            # there, so no exists() pre-checks are needed
+            self.audio_source.mkdir(parents=True, exist_ok=True)
+            self.transcript_dest.mkdir(parents=True, exist_ok=True)
+
             return True
-            
+
         except Exception as e:
-            self.logger.error(f"Error ensuring directories exist: {e}")
+            self.logger.error("Error ensuring directories exist: %s", e)
             return False
     
     def save_transcript_to_icloud(self, transcript_path: Path, original_audio_path: Path) -> bool:
@@ -70,27 +111,51 @@ class CloudSync:
             True if saved successfully, False otherwise
         """
         try:
-            if not transcript_path.exists():
-                self.logger.error(f"Transcript file does not exist: {transcript_path}")
-                return False
-            
             # Generate destination path in iCloud
             transcript_name = self._generate_transcript_name(original_audio_path)
             dest_path = self.transcript_dest / transcript_name
-            
+
             # Ensure destination directory exists
             dest_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Copy transcript to iCloud
-            shutil.copy2(transcript_path, dest_path)
-            
-            self.logger.info(f"Saved transcript to iCloud: {dest_path}")
+
+            # Copy transcript to iCloud. copyfile takes the platform
+            # fast-copy path (fcopyfile on macOS, sendfile on Linux) so the
+            # kernel moves the bytes; copystat preserves timestamps. A
+            # missing source surfaces as FileNotFoundError from the copy
+            # itself, so no exists() pre-check is needed.
+            shutil.copyfile(transcript_path, dest_path)
+            shutil.copystat(transcript_path, dest_path)
+
+            self.logger.info("Saved transcript to iCloud: %s", dest_path)
             return True
-            
+
+        except FileNotFoundError:
+            self.logger.error("Transcript file does not exist: %s", transcript_path)
+            return False
         except Exception as e:
-            self.logger.error(f"Error saving transcript to iCloud: {e}")
+            self.logger.error("Error saving transcript to iCloud: %s", e)
             return False
     
+    def save_transcripts_to_icloud(self, pairs: List[Tuple[Path, Path]]) -> List[bool]:
+        """
+        Save a batch of transcripts to iCloud Drive in parallel.
+
+        Copies overlap in a thread pool (copy/fsync release the GIL), so
+        per-file latencies against the iCloud mount stack up concurrently
+        instead of serially.
+
+        Args:
+            pairs: List of (transcript_path, original_audio_path) tuples
+
+        Returns:
+            List of per-pair success flags, in input order
+        """
+        if not pairs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(16, len(pairs))) as executor:
+            return list(executor.map(lambda pair: self.save_transcript_to_icloud(*pair), pairs))
+
     def _generate_transcript_name(self, audio_path: Path) -> str:
         """
         Generate transcript filename based on audio file.
@@ -121,37 +186,91 @@ class CloudSync:
     def wait_for_icloud_sync(self, file_path: Path, timeout: int = 60) -> bool:
         """
         Wait for a file to be synced to iCloud.
-        
+
+        Blocks on a file-system event for the target file (FSEvents on
+        macOS) instead of waking up to poll every second.
+
         Args:
             file_path: Path to the file to wait for
             timeout: Maximum time to wait in seconds
-            
+
         Returns:
             True if file is synced, False if timeout
         """
         try:
-            start_time = time.time()
-            
-            while time.time() - start_time < timeout:
-                if file_path.exists():
-                    # Check if file is fully synced (not just created)
-                    try:
-                        # Try to read the file to ensure it's fully written
-                        with open(file_path, 'r') as f:
-                            f.read(1024)  # Read first 1KB
+            # Fast path: file is already there and readable
+            if self._is_file_ready(file_path):
+                return True
+
+            synced = threading.Event()
+            handler = _FileSyncHandler(str(file_path), synced)
+
+            observer = self._create_sync_observer(file_path)
+            observer.schedule(handler, str(file_path.parent))
+            observer.start()
+
+            try:
+                # A file landing between the fast-path check and the
+                # watch starting produces no event; look again now that
+                # the observer is live
+                if self._is_file_ready(file_path):
+                    return True
+
+                deadline = time.time() + timeout
+                while True:
+                    remaining = deadline - time.time()
+                    if remaining <= 0 or not synced.wait(remaining):
+                        break
+
+                    # Event fired; confirm the file is fully written
+                    if self._is_file_ready(file_path):
                         return True
-                    except (IOError, OSError):
-                        # File might still be being written
-                        time.sleep(1)
-                        continue
-                
-                time.sleep(1)
-            
-            self.logger.warning(f"Timeout waiting for iCloud sync: {file_path}")
+                    synced.clear()
+
+                # Final check before reporting failure, in case the
+                # backend dropped the event for a file that did arrive
+                if self._is_file_ready(file_path):
+                    return True
+            finally:
+                observer.stop()
+                observer.join()
+
+            self.logger.warning("Timeout waiting for iCloud sync: %s", file_path)
             return False
-            
+
         except Exception as e:
-            self.logger.error(f"Error waiting for iCloud sync: {e}")
+            self.logger.error("Error waiting for iCloud sync: %s", e)
+            return False
+
+    def _create_sync_observer(self, file_path: Path):
+        """
+        Pick the watchdog backend for a single-file sync wait.
+
+        Native FSEvents/inotify backends are unreliable on iCloud
+        Drive's fused surface (same rationale as the monitor's observer
+        selection), so paths under it are watched by polling; the wait
+        is bounded and covers a single directory, so a short interval
+        is cheap.
+
+        Args:
+            file_path: File the caller is waiting on
+
+        Returns:
+            A watchdog observer instance (not yet started)
+        """
+        if 'Library/Mobile Documents' in str(file_path):
+            return PollingObserver(timeout=1)
+        return Observer()
+
+    def _is_file_ready(self, file_path: Path) -> bool:
+        """Check whether a file exists and is readable (fully written)."""
+        if not file_path.exists():
+            return False
+        try:
+            with open(file_path, 'r') as f:
+                f.read(1024)  # Read first 1KB
+            return True
+        except (IOError, OSError):
             return False
     
     def get_icloud_status(self) -> dict:
@@ -175,25 +294,59 @@ class CloudSync:
         # Get directory statistics if they exist
         if self.audio_source.exists():
             try:
-                audio_files = list(self.audio_source.rglob('*'))
-                status['audio_files_count'] = len([f for f in audio_files if f.is_file()])
-                status['audio_directories_count'] = len([f for f in audio_files if f.is_dir()])
+                files, dirs = self._count_entries(self.audio_source)
+                status['audio_files_count'] = files
+                status['audio_directories_count'] = dirs
             except Exception as e:
-                self.logger.warning(f"Error counting audio files: {e}")
+                self.logger.warning("Error counting audio files: %s", e)
                 status['audio_files_count'] = 0
                 status['audio_directories_count'] = 0
-        
+
         if self.transcript_dest.exists():
             try:
-                transcript_files = list(self.transcript_dest.rglob('*'))
-                status['transcript_files_count'] = len([f for f in transcript_files if f.is_file()])
-                status['transcript_directories_count'] = len([f for f in transcript_files if f.is_dir()])
+                files, dirs = self._count_entries(self.transcript_dest)
+                status['transcript_files_count'] = files
+                status['transcript_directories_count'] = dirs
             except Exception as e:
-                self.logger.warning(f"Error counting transcript files: {e}")
+                self.logger.warning("Error counting transcript files: %s", e)
                 status['transcript_files_count'] = 0
                 status['transcript_directories_count'] = 0
-        
+
         return status
+
+    def _count_entries(self, path: Path) -> Tuple[int, int]:
+        """
+        Count files and directories under a path.
+
+        Results are cached against the directory's mtime so repeated
+        status calls avoid re-walking an unchanged tree. The mtime only
+        changes when direct children do, so entries also expire after a
+        short TTL to bound how long changes in subdirectories can serve
+        a stale count.
+
+        Args:
+            path: Directory to count
+
+        Returns:
+            Tuple of (file_count, directory_count)
+        """
+        mtime = path.stat().st_mtime_ns
+        now = time.monotonic()
+        cached = self._status_cache.get(path)
+        if (cached is not None and cached[0] == mtime
+                and now - cached[3] < self._STATUS_CACHE_TTL):
+            return cached[1], cached[2]
+
+        # Single pass instead of materializing the tree twice
+        files = dirs = 0
+        for entry in path.rglob('*'):
+            if entry.is_file():
+                files += 1
+            elif entry.is_dir():
+                dirs += 1
+
+        self._status_cache[path] = (mtime, files, dirs, now)
+        return files, dirs
     
     def cleanup_old_transcripts(self, days_old: int = 30) -> int:
         """
@@ -212,21 +365,20 @@ class CloudSync:
             cutoff_time = time.time() - (days_old * 24 * 60 * 60)
             removed_count = 0
             
-            for transcript_file in self.transcript_dest.rglob('*'):
-                if transcript_file.is_file():
-                    try:
-                        if transcript_file.stat().st_mtime < cutoff_time:
-                            transcript_file.unlink()
-                            removed_count += 1
-                            self.logger.debug(f"Removed old transcript: {transcript_file}")
-                    except Exception as e:
-                        self.logger.warning(f"Error removing old transcript {transcript_file}: {e}")
+            for entry in _scan_files(self.transcript_dest):
+                try:
+                    if entry.stat().st_mtime < cutoff_time:
+                        os.unlink(entry.path)
+                        removed_count += 1
+                        self.logger.debug("Removed old transcript: %s", entry.path)
+                except Exception as e:
+                    self.logger.warning("Error removing old transcript %s: %s", entry.path, e)
             
             if removed_count > 0:
-                self.logger.info(f"Cleaned up {removed_count} old transcript files")
+                self.logger.info("Cleaned up %s old transcript files", removed_count)
             
             return removed_count
             
         except Exception as e:
-            self.logger.error(f"Error cleaning up old transcripts: {e}")
+            self.logger.error("Error cleaning up old transcripts: %s", e)
             return 0 
\ No newline at end of file
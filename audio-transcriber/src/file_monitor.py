@@ -2,79 +2,314 @@
 File monitoring and batch processing for audio files in iCloud.
 """
 
+import asyncio
+import ctypes
+import ctypes.util
+import itertools
+import json
+import os
+import struct
+import sys
+import threading
 import time
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Set, Optional, Callable
+from typing import Iterator, List, Optional, Callable
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
 import click
 
+from .utils import PipelineSettings
+
+
+# --- Darwin bulk directory enumeration -----------------------------------
+#
+# getattrlistbulk(2) returns name, object type and size for many entries
+# per syscall without instantiating a vnode per file, which matters on
+# iCloud Drive directories with thousands of entries. Non-macOS platforms
+# (and filesystems that reject the call) use os.scandir instead.
+
+_ATTR_BIT_MAP_COUNT = 5
+_ATTR_CMN_NAME = 0x00000001
+_ATTR_CMN_OBJTYPE = 0x00000008
+_ATTR_CMN_RETURNED_ATTRS = 0x80000000
+_ATTR_FILE_TOTALSIZE = 0x00000002
+_VDIR = 2
+
+
+class _AttrList(ctypes.Structure):
+    _fields_ = [
+        ('bitmapcount', ctypes.c_ushort),
+        ('reserved', ctypes.c_uint16),
+        ('commonattr', ctypes.c_uint32),
+        ('volattr', ctypes.c_uint32),
+        ('dirattr', ctypes.c_uint32),
+        ('fileattr', ctypes.c_uint32),
+        ('forkattr', ctypes.c_uint32),
+    ]
+
+
+if sys.platform == 'darwin':
+    _libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+
+    def _scan_getattrlistbulk(path: str) -> Iterator[tuple]:
+        """
+        Yield (name, is_dir, size) for each entry of a single directory.
+
+        One getattrlistbulk(2) round trip covers a few hundred entries,
+        replacing a stat call per file. Raises OSError if the call is
+        not supported on the underlying filesystem.
+        """
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            attrlist = _AttrList(
+                bitmapcount=_ATTR_BIT_MAP_COUNT,
+                commonattr=_ATTR_CMN_RETURNED_ATTRS | _ATTR_CMN_NAME | _ATTR_CMN_OBJTYPE,
+                fileattr=_ATTR_FILE_TOTALSIZE,
+            )
+            buf = ctypes.create_string_buffer(65536)
+
+            while True:
+                count = _libc.getattrlistbulk(fd, ctypes.byref(attrlist), buf, len(buf), 0)
+                if count < 0:
+                    errno = ctypes.get_errno()
+                    raise OSError(errno, os.strerror(errno), path)
+                if count == 0:
+                    return
+
+                raw = buf.raw
+                offset = 0
+                for _ in range(count):
+                    (length,) = struct.unpack_from('<I', raw, offset)
+                    pos = offset + 4
+
+                    # attribute_set_t: which attributes the kernel packed
+                    returned = struct.unpack_from('<5I', raw, pos)
+                    pos += 20
+
+                    name = None
+                    if returned[0] & _ATTR_CMN_NAME:
+                        name_off, name_len = struct.unpack_from('<iI', raw, pos)
+                        start = pos + name_off
+                        # attrreference data is NUL-terminated
+                        name = raw[start:start + name_len - 1].decode('utf-8', 'surrogateescape')
+                        pos += 8
+
+                    is_dir = False
+                    if returned[0] & _ATTR_CMN_OBJTYPE:
+                        (objtype,) = struct.unpack_from('<I', raw, pos)
+                        pos += 4
+                        is_dir = objtype == _VDIR
+
+                    size = 0
+                    if returned[3] & _ATTR_FILE_TOTALSIZE:
+                        (size,) = struct.unpack_from('<q', raw, pos)
+
+                    if name is not None:
+                        yield name, is_dir, size
+                    offset += length
+        finally:
+            os.close(fd)
+else:
+    _scan_getattrlistbulk = None
+
+
+class _BulkEntry:
+    """DirEntry-compatible shim over a getattrlistbulk result.
+
+    stat() returns self, carrying the st_size already delivered by the
+    bulk read, so consumers written against os.DirEntry work unchanged.
+    """
+
+    __slots__ = ('path', 'name', 'st_size')
+
+    def __init__(self, path: str, name: str, st_size: int):
+        self.path = path
+        self.name = name
+        self.st_size = st_size
+
+    def stat(self):
+        return self
+
+
+class TTLSet:
+    """Set whose members expire after a fixed time-to-live.
+
+    Used to deduplicate dispatches when the same file surfaces through
+    more than one path in a short window (double-fired watcher events,
+    or a startup scan racing the live monitor). Expiry is lazy: stale
+    entries are dropped when they are next looked up.
+    """
+
+    def __init__(self, ttl: float = 60.0):
+        """
+        Initialize TTLSet.
+
+        Args:
+            ttl: Seconds a key stays in the set after being added
+        """
+        self.ttl = ttl
+        self._entries: dict = {}
+        self._lock = threading.Lock()
+
+    def add(self, key) -> None:
+        """Add a key, refreshing its expiry time."""
+        with self._lock:
+            self._entries[key] = time.monotonic() + self.ttl
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            expires = self._entries.get(key)
+            if expires is None:
+                return False
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return False
+            return True
+
 
 class AudioFileHandler(FileSystemEventHandler):
     """Handles file system events for audio files."""
     
-    def __init__(self, callback: Callable[[Path], None], supported_formats: List[str]):
+    def __init__(self, enqueue: Callable[[Path], None], supported_formats: List[str]):
         """
         Initialize AudioFileHandler.
-        
+
         Args:
-            callback: Function to call when new audio file is detected
+            enqueue: Thread-safe function that hands a new audio file to
+                the monitor's intake loop (watchdog calls this handler
+                from its observer thread)
             supported_formats: List of supported audio file extensions
         """
-        self.callback = callback
+        self.enqueue = enqueue
         self.supported_formats = [fmt.lower() for fmt in supported_formats]
+        self._suffix_set = frozenset(f.lower().lstrip('.') for f in supported_formats)
         self.logger = logging.getLogger('audio_transcriber')
-        self.processed_files: Set[str] = set()
-    
+
     def on_created(self, event):
         """Handle file creation events."""
-        if not event.is_directory:
+        if not event.is_directory and self._accepts(event.src_path):
             file_path = Path(event.src_path)
-            if self._is_audio_file(file_path):
-                self.logger.info(f"New audio file detected: {file_path}")
-                # Wait a moment for file to be fully written
-                time.sleep(2)
-                self.callback(file_path)
-    
+            self.logger.info("New audio file detected: %s", file_path)
+            self.enqueue(file_path)
+
     def on_moved(self, event):
         """Handle file move events."""
-        if not event.is_directory:
+        if not event.is_directory and self._accepts(event.dest_path):
             file_path = Path(event.dest_path)
-            if self._is_audio_file(file_path):
-                self.logger.info(f"Audio file moved to: {file_path}")
-                time.sleep(2)
-                self.callback(file_path)
-    
-    def _is_audio_file(self, file_path: Path) -> bool:
-        """Check if file is a supported audio file."""
-        return file_path.suffix.lower() in self.supported_formats
+            self.logger.info("Audio file moved to: %s", file_path)
+            self.enqueue(file_path)
+
+    def on_modified(self, event):
+        """Handle file modification events (coalesced by the debouncer)."""
+        if not event.is_directory and self._accepts(event.src_path):
+            self.enqueue(Path(event.src_path))
+
+    def _accepts(self, path_str: str) -> bool:
+        """Fast reject on the raw event path, before any Path allocation.
+
+        Drops hidden files, temp files, and non-audio suffixes so only
+        real audio arrivals wake the intake loop.
+        """
+        name = os.path.basename(path_str)
+        if name.startswith('.') or name.endswith('.tmp'):
+            return False
+        return name.rpartition('.')[2].lower() in self._suffix_set
 
 
 class FileMonitor:
     """Monitors directories for new audio files and manages batch processing."""
+
+    # Marker file updated after a completed scan of a partition; scans
+    # skip partitions whose marker is newer than the directory itself
+    _PARTITION_MARKER = '.processed'
     
-    def __init__(self, config: dict, callback: Callable[[Path], None]):
+    def __init__(self, config: dict, callback: Callable[[Path], None],
+                 recent: Optional[TTLSet] = None,
+                 settings: Optional[PipelineSettings] = None):
         """
         Initialize FileMonitor.
-        
+
         Args:
             config: Configuration dictionary
             callback: Function to call for each audio file
+            recent: Shared recently-dispatched set for deduplication
+                (a private one is created when omitted)
+            settings: Pre-resolved hot-path settings (built from config
+                when omitted)
         """
         self.config = config
         self.callback = callback
+        self.settings = settings if settings is not None else PipelineSettings.from_config(config)
+        self._recent = recent if recent is not None else TTLSet(ttl=60.0)
         self.logger = logging.getLogger('audio_transcriber')
         
         # Configuration
         self.monitoring_config = config.get('monitoring', {})
         self.audio_config = config.get('audio', {})
         self.supported_formats = self.audio_config.get('supported_formats', [])
+
+        # O(1) suffix membership on raw entry names (extensions sans dot)
+        self._suffix_set = self.settings.supported_formats
+
+        # Transcript naming suffix resolved once instead of per file
+        self._transcript_suffix = '_transcript.' + self.settings.output_format
         
+        # Optional YYYY/MM partitioning of the watched root. Off unless
+        # configured: it physically moves the user's files
+        self._partition = self.monitoring_config.get('partition_by', 'none')
+        self._source_path: Optional[Path] = None
+
         # Monitoring state
         self.observer = None
         self.is_monitoring = False
-        self.processed_files: Set[str] = set()
+
+        # Async intake loop state (created on start_monitoring)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_ready: Optional[threading.Event] = None
+        self._event_queue: Optional[asyncio.Queue] = None
+
+        # Debounce window: per-path last-event times (loop thread only)
+        self._debounce_s = self.settings.debounce_seconds
+        self._pending: dict = {}
+
+        # Worker pool for the per-file pipeline: the callback is disk/
+        # network/model-bound, so a few files in flight overlap their
+        # latencies. The semaphore bounds submissions so a burst of events
+        # cannot queue unbounded work
+        self._workers = self.settings.concurrency
+        self._pool = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix='pipeline')
+        self._inflight = threading.BoundedSemaphore(self._workers * 2)
+
+        # On-disk ledger of already-processed files (path -> [size, mtime])
+        # so startup scans skip stable files in O(1) instead of re-checking
+        # every transcript
+        self._ledger_path = Path(self.monitoring_config.get('ledger_path', 'config/processed.json'))
+        self._ledger: dict = self._load_ledger()
+
+    def _load_ledger(self) -> dict:
+        """Load the processed-files ledger from disk, if present."""
+        try:
+            with open(self._ledger_path, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        except Exception as e:
+            self.logger.warning("Could not load processed-files ledger: %s", e)
+            return {}
+
+    def _save_ledger(self) -> None:
+        """Write the processed-files ledger back to disk."""
+        try:
+            with open(self._ledger_path, 'w') as f:
+                json.dump(self._ledger, f)
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception as e:
+            self.logger.warning("Could not save processed-files ledger: %s", e)
     
     def start_monitoring(self, source_path: Path) -> bool:
         """
@@ -88,31 +323,72 @@ class FileMonitor:
         """
         try:
             if not source_path.exists():
-                self.logger.error(f"Source directory does not exist: {source_path}")
+                self.logger.error("Source directory does not exist: %s", source_path)
                 return False
             
             if not source_path.is_dir():
-                self.logger.error(f"Source path is not a directory: {source_path}")
+                self.logger.error("Source path is not a directory: %s", source_path)
                 return False
             
+            self._source_path = source_path
+
+            # Start the asyncio intake loop on its own thread; watchdog
+            # events are bridged onto it so handlers never block the
+            # observer thread
+            self._loop = asyncio.new_event_loop()
+            self._loop_ready = threading.Event()
+            self._loop_thread = threading.Thread(
+                target=self._run_event_loop, name='file-monitor-loop', daemon=True
+            )
+            self._loop_thread.start()
+            self._loop_ready.wait()
+
             # Create event handler
-            event_handler = AudioFileHandler(self.callback, self.supported_formats)
-            
-            # Create observer
-            self.observer = Observer()
-            self.observer.schedule(event_handler, str(source_path), recursive=True)
-            
+            event_handler = AudioFileHandler(self._enqueue_event, self.supported_formats)
+
+            # Create observer; watch only the source directory itself
+            # unless subdirectory monitoring is explicitly enabled
+            recursive = self.settings.recursive
+            self.observer = self._create_observer(source_path)
+            self.observer.schedule(event_handler, str(source_path), recursive=recursive)
+
             # Start monitoring
             self.observer.start()
             self.is_monitoring = True
-            
-            self.logger.info(f"Started monitoring directory: {source_path}")
+
+            self.logger.info("Started monitoring directory: %s", source_path)
             return True
-            
+
         except Exception as e:
-            self.logger.error(f"Error starting file monitoring: {e}")
+            self.logger.error("Error starting file monitoring: %s", e)
             return False
-    
+
+    def _create_observer(self, source_path: Path):
+        """
+        Pick the observer backend for a source directory.
+
+        Native FSEvents/inotify backends are unreliable on iCloud Drive's
+        fused surface, and watchdog's PollingObserver defaults to walking
+        the tree every second. Select via monitoring.backend ('auto',
+        'native', or 'polling'); 'auto' uses polling with a long interval
+        for paths under iCloud Drive and the native backend elsewhere.
+
+        Args:
+            source_path: Directory that will be watched
+
+        Returns:
+            A watchdog observer instance (not yet started)
+        """
+        backend = self.settings.backend
+        poll_interval = self.settings.poll_interval
+
+        if backend == 'polling' or (
+                backend == 'auto' and 'Library/Mobile Documents' in str(source_path)):
+            self.logger.info("Using polling observer (interval: %ss)", poll_interval)
+            return PollingObserver(timeout=poll_interval)
+
+        return Observer()
+
     def stop_monitoring(self) -> None:
         """Stop file monitoring."""
         if self.observer and self.is_monitoring:
@@ -120,6 +396,254 @@ class FileMonitor:
             self.observer.join()
             self.is_monitoring = False
             self.logger.info("Stopped file monitoring")
+
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._shutdown_loop)
+            self._loop_thread.join()
+            self._loop.close()
+            self._loop = None
+            self._loop_thread = None
+            self._event_queue = None
+
+        # Let in-flight pipeline work finish before returning
+        self._pool.shutdown(wait=True)
+
+    def _dispatch(self, file_path: Path) -> Future:
+        """
+        Submit the pipeline callback to the worker pool.
+
+        Blocks when twice the worker count is already in flight, so event
+        bursts apply backpressure instead of queueing unbounded work.
+
+        Args:
+            file_path: Audio file to hand to the callback
+
+        Returns:
+            Future resolving to the callback's result
+        """
+        self._inflight.acquire()
+        try:
+            future = self._pool.submit(self.callback, file_path)
+        except BaseException:
+            self._inflight.release()
+            raise
+        future.add_done_callback(lambda _f: self._inflight.release())
+        return future
+
+    def _run_event_loop(self) -> None:
+        """Run the asyncio intake loop (dedicated thread)."""
+        asyncio.set_event_loop(self._loop)
+        self._event_queue = asyncio.Queue()
+        self._loop.create_task(self._consume_events())
+        self._loop_ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            asyncio.set_event_loop(None)
+
+    def _shutdown_loop(self) -> None:
+        """Cancel in-flight tasks and stop the intake loop (loop thread)."""
+        for task in asyncio.all_tasks(self._loop):
+            task.cancel()
+        self._loop.call_soon(self._loop.stop)
+
+    def _enqueue_event(self, file_path: Path) -> None:
+        """Bridge a watchdog event onto the intake loop (any thread)."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._event_queue.put_nowait, file_path)
+
+    async def _consume_events(self) -> None:
+        """Debounce queued events and dispatch one task per settled file.
+
+        Editors that rename-then-write, or tools that touch a file several
+        times, produce event bursts; coalescing per path means each file
+        runs the pipeline once per burst.
+        """
+        while True:
+            file_path = await self._event_queue.get()
+            key = str(file_path)
+            first_sighting = key not in self._pending
+            self._pending[key] = time.monotonic()
+            if first_sighting:
+                self._loop.call_later(self._debounce_s, self._maybe_fire, file_path)
+
+    def _maybe_fire(self, file_path: Path) -> None:
+        """Fire the handler once no new events arrived within the window."""
+        key = str(file_path)
+        last = self._pending.get(key)
+        if last is None:
+            return
+
+        remaining = self._debounce_s - (time.monotonic() - last)
+        if remaining > 0:
+            # Another event landed during the window; push the deadline out
+            self._loop.call_later(remaining, self._maybe_fire, file_path)
+            return
+
+        del self._pending[key]
+
+        # Double-fired events and scan/monitor races collapse here
+        if key in self._recent:
+            self.logger.debug("Recently dispatched, skipping: %s", file_path)
+            return
+        self._recent.add(key)
+
+        asyncio.ensure_future(self._handle_file(file_path))
+
+    async def _handle_file(self, file_path: Path) -> None:
+        """Wait for a file to finish writing, then run the callback."""
+        try:
+            if not await self._wait_until_stable(file_path):
+                self.logger.warning("File never stabilized, skipping: %s", file_path)
+                return
+            file_path = self._maybe_partition(file_path)
+            await asyncio.wrap_future(self._dispatch(file_path))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.error("Error processing file %s: %s", file_path, e)
+
+    async def _wait_until_stable(self, file_path: Path, interval: float = 0.25,
+                                 timeout: float = 30.0) -> bool:
+        """
+        Wait until a file's size and mtime are stable across two samples.
+
+        Replaces the old blind 2-second sleep: atomically-renamed files
+        proceed after one interval, and large files still being written
+        are not picked up early. Sampling the mtime alongside the size
+        also catches in-place rewrites that happen to keep the same
+        length.
+
+        Args:
+            file_path: File to probe
+            interval: Seconds between samples
+            timeout: Give up after this many seconds
+
+        Returns:
+            True once the file is stable, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+        last_sample = None
+
+        while time.monotonic() < deadline:
+            try:
+                stat = os.stat(file_path)
+                sample = (stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                sample = None  # not visible yet (still syncing/renaming)
+
+            if sample is not None and sample == last_sample:
+                return True
+
+            last_sample = sample
+            await asyncio.sleep(interval)
+
+        return False
+
+    def _maybe_partition(self, file_path: Path) -> Path:
+        """
+        Move a newly arrived root-level file into its YYYY/MM partition.
+
+        No-op unless monitoring.partition_by is enabled and the file sits
+        directly in the watched root. The move is an os.replace, so on
+        the same volume it is a rename, not a copy.
+
+        Args:
+            file_path: File that just settled
+
+        Returns:
+            The file's (possibly new) path
+        """
+        if self._partition == 'none' or self._source_path is None:
+            return file_path
+        if file_path.parent != self._source_path:
+            return file_path  # already partitioned or nested
+
+        try:
+            mtime = time.localtime(file_path.stat().st_mtime)
+            dest_dir = self._source_path / f"{mtime.tm_year:04d}" / f"{mtime.tm_mon:02d}"
+            dest_dir.mkdir(parents=True, exist_ok=True)
+            dest = dest_dir / file_path.name
+            os.replace(file_path, dest)
+            self.logger.debug("Partitioned %s -> %s", file_path, dest)
+            return dest
+        except OSError as e:
+            self.logger.warning("Could not partition %s: %s", file_path, e)
+            return file_path
+
+    def _iter_partitioned_audio_files(self, source_path: Path,
+                                      visited: List[Path]) -> Iterator[Path]:
+        """
+        Yield audio files, skipping partitions with a current marker.
+
+        Partitions are the YYYY/MM leaf directories; each marker is
+        compared against its own month directory's mtime (a file added
+        to 2026/08 bumps 08's mtime, not 2026's), so only partitions
+        whose contents actually changed are rescanned.
+
+        Args:
+            source_path: Watched root directory
+            visited: Output list of partition dirs that were scanned
+                (the caller stamps their markers after a clean pass)
+
+        Yields:
+            Audio file paths
+        """
+        try:
+            with os.scandir(source_path) as it:
+                entries = list(it)
+        except OSError as e:
+            self.logger.error("Error searching for audio files: %s", e)
+            return
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from self._iter_partition_leaves(Path(entry.path), visited)
+            elif entry.is_file(follow_symlinks=False):
+                if entry.name.rpartition('.')[2].lower() in self._suffix_set:
+                    yield Path(entry.path)
+
+    def _iter_partition_leaves(self, year_dir: Path,
+                               visited: List[Path]) -> Iterator[Path]:
+        """Scan one year directory's month partitions, honoring markers.
+
+        Args:
+            year_dir: First-level (YYYY) directory under the root
+            visited: Output list of scanned partition dirs
+
+        Yields:
+            Audio file paths
+        """
+        try:
+            with os.scandir(year_dir) as it:
+                entries = list(it)
+        except OSError as e:
+            self.logger.error("Error searching for audio files: %s", e)
+            return
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdir = Path(entry.path)
+                try:
+                    marker_mtime = (subdir / self._PARTITION_MARKER).stat().st_mtime
+                    if marker_mtime >= entry.stat().st_mtime:
+                        self.logger.debug("Skipping unchanged partition: %s", subdir)
+                        continue
+                except OSError:
+                    pass  # no marker yet; scan the partition
+
+                yield from self._iter_audio_files(subdir)
+                visited.append(subdir)
+            elif entry.is_file(follow_symlinks=False):
+                if entry.name.rpartition('.')[2].lower() in self._suffix_set:
+                    yield Path(entry.path)
+
+    def _touch_partition_marker(self, subdir: Path) -> None:
+        """Stamp a partition's marker after a completed scan."""
+        try:
+            (subdir / self._PARTITION_MARKER).touch()
+        except OSError as e:
+            self.logger.warning("Could not update partition marker in %s: %s", subdir, e)
     
     def process_existing_files(self, source_path: Path, dest_path: Path) -> List[Path]:
         """
@@ -133,94 +657,233 @@ class FileMonitor:
             List of processed file paths
         """
         processed_files = []
-        
+
         try:
             if not source_path.exists():
-                self.logger.warning(f"Source directory does not exist: {source_path}")
+                self.logger.warning("Source directory does not exist: %s", source_path)
                 return processed_files
-            
-            # Find all audio files
-            audio_files = self._find_audio_files(source_path)
-            
-            if not audio_files:
+
+            skip_existing = self.settings.skip_existing
+            batch_size = self.settings.batch_size
+
+            # One directory read up front replaces a stat per candidate
+            existing_transcripts = (
+                self._load_existing_transcripts(dest_path) if skip_existing else frozenset()
+            )
+
+            # Pull from the scandir generator one batch at a time: work
+            # starts after the first batch is gathered, and memory stays
+            # O(batch) instead of O(tree)
+            # With partitioning on, whole unchanged YYYY/MM subtrees are
+            # skipped via their markers
+            visited_partitions: List[Path] = []
+            if self._partition != 'none':
+                audio_files = self._iter_partitioned_audio_files(source_path, visited_partitions)
+            else:
+                audio_files = self._iter_audio_files(source_path)
+            found_any = False
+            ledger_dirty = 0
+            failed_files: List[Path] = []
+
+            while True:
+                batch = list(itertools.islice(audio_files, batch_size))
+                if not batch:
+                    break
+                found_any = True
+
+                # Transcript-existence checks are incremental per batch
+                if skip_existing:
+                    batch = self._filter_existing_transcripts(batch, dest_path, existing_transcripts)
+
+                # Fan the batch out across the worker pool; _dispatch
+                # blocks once the in-flight bound is reached
+                pending = []
+                for audio_file in batch:
+                    try:
+                        # Skip files the ledger already records as processed
+                        # at their current size/mtime
+                        key = str(audio_file)
+                        stat = audio_file.stat()
+                        signature = [stat.st_size, int(stat.st_mtime)]
+                        if self._ledger.get(key) == signature:
+                            self.logger.debug("Skipping %s - in processed ledger", audio_file)
+                            continue
+
+                        # Don't race the live monitor over the same file
+                        if key in self._recent:
+                            self.logger.debug("Recently dispatched, skipping: %s", audio_file)
+                            continue
+                        self._recent.add(key)
+
+                        pending.append((self._dispatch(audio_file), audio_file, key, signature))
+                    except Exception as e:
+                        self.logger.error("Error processing file %s: %s", audio_file, e)
+                        failed_files.append(audio_file)
+
+                for future, audio_file, key, signature in pending:
+                    try:
+                        # The callback reports failure by returning falsy
+                        # rather than raising; only a truthy result marks
+                        # the file processed, so failures are retried on
+                        # the next scan instead of being skipped forever
+                        if future.result():
+                            processed_files.append(audio_file)
+                            self._ledger[key] = signature
+                            ledger_dirty += 1
+                        else:
+                            self.logger.warning("Processing failed, will retry on next scan: %s", audio_file)
+                            failed_files.append(audio_file)
+                    except Exception as e:
+                        self.logger.error("Error processing file %s: %s", audio_file, e)
+                        failed_files.append(audio_file)
+
+                # Flush the ledger once per batch, not once per file
+                if ledger_dirty:
+                    self._save_ledger()
+                    ledger_dirty = 0
+
+            if not found_any:
                 self.logger.info("No audio files found in source directory")
-                return processed_files
-            
-            self.logger.info(f"Found {len(audio_files)} audio files to process")
-            
-            # Check for existing transcripts
-            skip_existing = self.monitoring_config.get('skip_existing', True)
-            if skip_existing:
-                audio_files = self._filter_existing_transcripts(audio_files, dest_path)
-                self.logger.info(f"After filtering existing transcripts: {len(audio_files)} files")
-            
-            # Process files
-            for audio_file in audio_files:
-                try:
-                    self.callback(audio_file)
-                    processed_files.append(audio_file)
-                except Exception as e:
-                    self.logger.error(f"Error processing file {audio_file}: {e}")
-            
+
+            # Stamp fully scanned partitions so untouched ones are
+            # skipped on the next pass; a partition with any failed file
+            # stays unmarked so the next scan retries it
+            for subdir in visited_partitions:
+                if any(subdir in f.parents for f in failed_files):
+                    continue
+                self._touch_partition_marker(subdir)
+
             return processed_files
-            
+
         except Exception as e:
-            self.logger.error(f"Error processing existing files: {e}")
+            self.logger.error("Error processing existing files: %s", e)
             return processed_files
     
+    def _iter_audio_entries(self, directory) -> Iterator:
+        """
+        Yield DirEntry-like objects for audio files under a directory.
+
+        Entry types come from the directory read itself (no stat per
+        file), and the suffix filter runs on the raw entry name before
+        any Path object is built. Consumers that need sizes can use the
+        entry's cached stat without a second kernel round trip.
+
+        Args:
+            directory: Directory to search
+
+        Yields:
+            DirEntry-like objects for audio files
+        """
+        # Prefer the getattrlistbulk backend on macOS; one syscall covers
+        # a few hundred entries with name, type and size in hand
+        if _scan_getattrlistbulk is not None:
+            yielded = False
+            try:
+                for entry in self._iter_audio_entries_bulk(str(directory)):
+                    yielded = True
+                    yield entry
+                return
+            except OSError as e:
+                if yielded:
+                    self.logger.error("Error searching for audio files: %s", e)
+                    return
+                # Filesystem rejected the call before producing anything;
+                # fall through to the portable scandir walk
+                self.logger.debug("getattrlistbulk unavailable for %s: %s", directory, e)
+
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from self._iter_audio_entries(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        if entry.name.rpartition('.')[2].lower() in self._suffix_set:
+                            yield entry
+        except OSError as e:
+            self.logger.error("Error searching for audio files: %s", e)
+
+    def _iter_audio_entries_bulk(self, directory: str) -> Iterator[_BulkEntry]:
+        """Recursive audio-file walk over the getattrlistbulk backend."""
+        for name, is_dir, size in _scan_getattrlistbulk(directory):
+            child = os.path.join(directory, name)
+            if is_dir:
+                yield from self._iter_audio_entries_bulk(child)
+            elif name.rpartition('.')[2].lower() in self._suffix_set:
+                yield _BulkEntry(child, name, size)
+
+    def _iter_audio_files(self, directory) -> Iterator[Path]:
+        """Yield audio file paths under a directory recursively."""
+        for entry in self._iter_audio_entries(directory):
+            yield Path(entry.path)
+
     def _find_audio_files(self, directory: Path) -> List[Path]:
         """
-        Find all audio files in a directory recursively.
-        
+        Find all audio files in a directory recursively, sorted.
+
+        Boundary helper for callers that present results to a human and
+        need a stable order. Internal consumers (startup scans, stats)
+        pull from _iter_audio_files directly, which keeps discovery
+        streaming and skips the O(N log N) sort and N-sized list.
+
         Args:
             directory: Directory to search
-            
+
         Returns:
-            List of audio file paths
+            Sorted list of audio file paths
         """
-        audio_files = []
-        
-        try:
-            for file_path in directory.rglob('*'):
-                if file_path.is_file() and self._is_audio_file(file_path):
-                    audio_files.append(file_path)
-        except Exception as e:
-            self.logger.error(f"Error searching for audio files: {e}")
-        
-        return sorted(audio_files)
-    
-    def _is_audio_file(self, file_path: Path) -> bool:
-        """Check if file is a supported audio file."""
-        return file_path.suffix.lower() in self.supported_formats
+        return sorted(self._iter_audio_files(directory))
+
+    def _is_audio_file(self, file_path) -> bool:
+        """Check if a path names a supported audio file.
+
+        Accepts a Path or a raw string; the suffix test runs on the
+        string itself so event paths need no Path construction first.
+        """
+        return str(file_path).rpartition('.')[2].lower() in self._suffix_set
     
-    def _filter_existing_transcripts(self, audio_files: List[Path], dest_path: Path) -> List[Path]:
+    def _load_existing_transcripts(self, dest_path: Path) -> frozenset:
+        """
+        Snapshot existing transcript names with a single directory read.
+
+        Args:
+            dest_path: Directory containing transcripts
+
+        Returns:
+            Frozenset of transcript filenames present in dest_path
+        """
+        # listdir beats scandir when only names are needed: one syscall,
+        # one list, no DirEntry objects
+        try:
+            return frozenset(os.listdir(dest_path))
+        except FileNotFoundError:
+            return frozenset()
+
+    def _filter_existing_transcripts(self, audio_files: List[Path], dest_path: Path,
+                                     existing: Optional[frozenset] = None) -> List[Path]:
         """
         Filter out audio files that already have transcripts.
-        
+
+        Membership is tested against an in-memory snapshot of the
+        destination directory instead of a stat per candidate.
+
         Args:
             audio_files: List of audio file paths
             dest_path: Directory containing transcripts
-            
+            existing: Pre-loaded transcript-name snapshot (loaded from
+                dest_path when omitted)
+
         Returns:
             List of audio files without existing transcripts
         """
-        filtered_files = []
-        
-        for audio_file in audio_files:
-            transcript_name = self._get_transcript_name(audio_file)
-            transcript_path = dest_path / transcript_name
-            
-            if not transcript_path.exists():
-                filtered_files.append(audio_file)
-            else:
-                self.logger.debug(f"Skipping {audio_file} - transcript exists")
-        
-        return filtered_files
+        if existing is None:
+            existing = self._load_existing_transcripts(dest_path)
+
+        suffix = self._transcript_suffix
+        return [af for af in audio_files if (af.stem + suffix) not in existing]
     
     def _get_transcript_name(self, audio_file: Path) -> str:
         """Generate transcript filename for an audio file."""
-        output_format = self.config.get('transcription', {}).get('output_format', 'txt')
-        return f"{audio_file.stem}_transcript.{output_format}"
+        return audio_file.stem + self._transcript_suffix
     
     def get_file_stats(self, source_path: Path) -> dict:
         """
@@ -233,25 +896,23 @@ class FileMonitor:
             Dictionary with file statistics
         """
         try:
-            audio_files = self._find_audio_files(source_path)
-            
             stats = {
-                'total_files': len(audio_files),
+                'total_files': 0,
                 'total_size_mb': 0,
                 'formats': {}
             }
-            
-            for audio_file in audio_files:
-                # Calculate total size
-                file_size = audio_file.stat().st_size / (1024 * 1024)  # MB
-                stats['total_size_mb'] += file_size
-                
-                # Count formats
-                extension = audio_file.suffix.lower()
-                stats['formats'][extension] = stats['formats'].get(extension, 0) + 1
-            
+            formats = stats['formats']
+
+            # Single scandir pass; sizes come from the DirEntry stat cache
+            for entry in self._iter_audio_entries(source_path):
+                stats['total_files'] += 1
+                stats['total_size_mb'] += entry.stat().st_size / (1024 * 1024)
+
+                extension = '.' + entry.name.rpartition('.')[2].lower()
+                formats[extension] = formats.get(extension, 0) + 1
+
             return stats
-            
+
         except Exception as e:
-            self.logger.error(f"Error getting file stats: {e}")
+            self.logger.error("Error getting file stats: %s", e)
             return {'total_files': 0, 'total_size_mb': 0, 'formats': {}} 
\ No newline at end of file
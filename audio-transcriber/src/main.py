@@ -2,17 +2,25 @@
 Main entry point for the Audio Transcriber application.
 """
 
+import os
 import sys
 import signal
+import hashlib
+import json
 import logging
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 import click
 
-from .utils import load_config, setup_logging, validate_config, get_icloud_paths, format_file_size
-from .audio_processor import AudioProcessor
+from .utils import (load_config, setup_logging, validate_config, get_icloud_paths,
+                    format_file_size, PipelineSettings)
+from .audio_processor import AudioProcessor, _process_file_worker
 from .transcriber import Transcriber
-from .file_monitor import FileMonitor
+from .file_monitor import FileMonitor, TTLSet
 from .cloud_sync import CloudSync
 
 
@@ -28,42 +36,110 @@ class AudioTranscriber:
         """
         self.config_path = config_path
         self.config = load_config(config_path)
+        # Hot-path settings resolved once; per-file code reads slot
+        # attributes instead of chasing nested dicts
+        self.settings = PipelineSettings.from_config(self.config)
         self.logger = None
-        self.audio_processor = None
-        self.transcriber = None
-        self.file_monitor = None
-        self.cloud_sync = None
         self.is_running = False
-        
+        self._stop = threading.Event()
+
+        # Shared dedup window so the live monitor and startup scans never
+        # dispatch the same file twice in close succession
+        self._recent = TTLSet(ttl=60.0)
+
+        # Persistent result cache: content key -> transcript name. Lets
+        # repeat deliveries of the same file (iCloud re-download, user
+        # re-save) skip the whole pipeline.
+        self._result_cache_path = Path(config_path).parent / 'result_cache.json'
+        self._result_cache = self._load_result_cache()
+
         # Initialize components
         self._initialize_components()
+
+    def _load_result_cache(self) -> dict:
+        """Load the pipeline result cache from disk, if present."""
+        try:
+            with open(self._result_cache_path, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        except Exception:
+            return {}
+
+    def _save_result_cache(self) -> None:
+        """Write the pipeline result cache back to disk."""
+        try:
+            with open(self._result_cache_path, 'w') as f:
+                json.dump(self._result_cache, f)
+        except Exception as e:
+            self.logger.warning("Could not save result cache: %s", e)
+
+    def _result_cache_key(self, audio_path: Path) -> Optional[str]:
+        """
+        Build a content key for an audio file.
+
+        The key combines size, mtime and a hash of the first 64 KiB, so
+        it survives renames and path changes but invalidates whenever
+        the content is actually rewritten.
+
+        Args:
+            audio_path: Path to the audio file
+
+        Returns:
+            Cache key string, or None if the file cannot be read
+        """
+        try:
+            stat = audio_path.stat()
+            with open(audio_path, 'rb') as f:
+                digest = hashlib.blake2b(f.read(65536)).hexdigest()
+            return f"{stat.st_size}:{int(stat.st_mtime)}:{digest}"
+        except OSError:
+            return None
     
     def _initialize_components(self) -> None:
-        """Initialize all application components."""
+        """Set up logging and validate configuration.
+
+        The components themselves are cached properties built on first
+        use, so commands that never transcribe (status, cleanup) never
+        pay the Whisper model load.
+        """
         try:
             # Setup logging
             self.logger = setup_logging(self.config)
-            
+
             # Validate configuration
             if not validate_config(self.config):
                 raise ValueError("Invalid configuration")
-            
-            # Initialize components
-            self.audio_processor = AudioProcessor(self.config)
-            self.transcriber = Transcriber(self.config)
-            self.cloud_sync = CloudSync(self.config)
-            
-            # Initialize file monitor with callback
-            self.file_monitor = FileMonitor(self.config, self.process_audio_file)
-            
+
             self.logger.info("Audio Transcriber initialized successfully")
-            
+
         except Exception as e:
             if self.logger:
-                self.logger.error(f"Error initializing Audio Transcriber: {e}")
+                self.logger.error("Error initializing Audio Transcriber: %s", e)
             else:
                 print(f"Error initializing Audio Transcriber: {e}")
             raise
+
+    @cached_property
+    def audio_processor(self) -> AudioProcessor:
+        """Audio preprocessor, created on first use."""
+        return AudioProcessor(self.config)
+
+    @cached_property
+    def transcriber(self) -> Transcriber:
+        """Transcription engine, created on first use (loads the model)."""
+        return Transcriber(self.config)
+
+    @cached_property
+    def cloud_sync(self) -> CloudSync:
+        """iCloud sync helper, created on first use."""
+        return CloudSync(self.config)
+
+    @cached_property
+    def file_monitor(self) -> FileMonitor:
+        """File monitor wired to the processing pipeline, created on first use."""
+        return FileMonitor(self.config, self.process_audio_file,
+                           recent=self._recent, settings=self.settings)
     
     def process_audio_file(self, audio_path: Path) -> bool:
         """
@@ -76,59 +152,152 @@ class AudioTranscriber:
             True if processing was successful, False otherwise
         """
         try:
-            self.logger.info(f"Starting processing pipeline for: {audio_path}")
-            
-            # Step 1: Process audio file
-            processed_audio_path = self.audio_processor.process_audio_file(audio_path)
-            if processed_audio_path is None:
-                self.logger.error(f"Failed to process audio file: {audio_path}")
+            self.logger.info("Starting processing pipeline for: %s", audio_path)
+
+            # Step 0: Skip the whole pipeline if this exact content was
+            # already transcribed and the transcript is still on iCloud
+            cache_key = self._result_cache_key(audio_path)
+            if cache_key is not None:
+                transcript_name = self._result_cache.get(cache_key)
+                if transcript_name is not None:
+                    if (self.cloud_sync.transcript_dest / transcript_name).exists():
+                        self.logger.info("Transcript already exists for %s, skipping", audio_path)
+                        return True
+                    # Transcript was removed; reprocess and refresh the entry
+                    del self._result_cache[cache_key]
+
+            # Step 1: Process audio file (float32 samples, in-memory)
+            audio_samples = self.audio_processor.process_audio_file(audio_path)
+            if audio_samples is None:
+                self.logger.error("Failed to process audio file: %s", audio_path)
                 return False
-            
+
+            return self._transcribe_and_save(audio_path, audio_samples)
+
+        except Exception as e:
+            self.logger.error("Error in processing pipeline for %s: %s", audio_path, e)
+            return False
+
+    def _transcribe_and_save(self, audio_path: Path, audio_samples) -> bool:
+        """
+        Transcribe preprocessed samples and save the transcript.
+
+        Args:
+            audio_path: Original audio file path
+            audio_samples: Float32 samples from AudioProcessor
+
+        Returns:
+            True if transcription and save succeeded, False otherwise
+        """
+        try:
+            # Step 2: Transcribe audio
+            transcription_data = self.transcriber.transcribe_audio(audio_samples, audio_path)
+            if transcription_data is None:
+                self.logger.error("Failed to transcribe audio file: %s", audio_path)
+                return False
+
+            # Step 3: Save transcript locally
+            transcript_filename = f"{audio_path.stem}_transcript.{self.settings.output_format}"
+            transcript_path = Path.cwd() / transcript_filename
+
+            if not self.transcriber.save_transcript(transcription_data, transcript_path):
+                self.logger.error("Failed to save transcript: %s", transcript_path)
+                return False
+
+            # Step 4: Save transcript to iCloud
+            if not self.cloud_sync.save_transcript_to_icloud(transcript_path, audio_path):
+                self.logger.error("Failed to save transcript to iCloud: %s", audio_path)
+                return False
+
+            # Record the upload so repeat deliveries of the same content
+            # skip straight past the pipeline
+            cache_key = self._result_cache_key(audio_path)
+            if cache_key is not None:
+                self._result_cache[cache_key] = self.cloud_sync._generate_transcript_name(audio_path)
+                self._save_result_cache()
+
+            # Step 5: Get and log statistics
+            stats = self.transcriber.get_transcription_stats(transcription_data)
+            self.logger.info("Transcription completed successfully:")
+            self.logger.info("  - Words: %s", stats.get('word_count', 0))
+            self.logger.info("  - Characters: %s", stats.get('character_count', 0))
+            self.logger.info("  - Language: %s", stats.get('language', 'unknown'))
+            self.logger.info("  - Model: %s", stats.get('model_used', 'unknown'))
+
+            # Clean up local transcript file
             try:
-                # Step 2: Transcribe audio
-                transcription_data = self.transcriber.transcribe_audio(processed_audio_path)
-                if transcription_data is None:
-                    self.logger.error(f"Failed to transcribe audio file: {audio_path}")
-                    return False
-                
-                # Step 3: Save transcript locally
-                output_format = self.config.get('transcription', {}).get('output_format', 'txt')
-                transcript_filename = f"{audio_path.stem}_transcript.{output_format}"
-                transcript_path = Path.cwd() / transcript_filename
-                
-                if not self.transcriber.save_transcript(transcription_data, transcript_path):
-                    self.logger.error(f"Failed to save transcript: {transcript_path}")
-                    return False
-                
-                # Step 4: Save transcript to iCloud
-                if not self.cloud_sync.save_transcript_to_icloud(transcript_path, audio_path):
-                    self.logger.error(f"Failed to save transcript to iCloud: {audio_path}")
-                    return False
-                
-                # Step 5: Get and log statistics
-                stats = self.transcriber.get_transcription_stats(transcription_data)
-                self.logger.info(f"Transcription completed successfully:")
-                self.logger.info(f"  - Words: {stats.get('word_count', 0)}")
-                self.logger.info(f"  - Characters: {stats.get('character_count', 0)}")
-                self.logger.info(f"  - Language: {stats.get('language', 'unknown')}")
-                self.logger.info(f"  - Model: {stats.get('model_used', 'unknown')}")
-                
-                # Clean up local transcript file
-                try:
-                    transcript_path.unlink()
-                except Exception as e:
-                    self.logger.warning(f"Could not clean up local transcript: {e}")
-                
-                return True
-                
-            finally:
-                # Always clean up processed audio file
-                self.audio_processor.cleanup_temp_file(processed_audio_path)
-            
+                transcript_path.unlink()
+            except Exception as e:
+                self.logger.warning("Could not clean up local transcript: %s", e)
+
+            return True
+
         except Exception as e:
-            self.logger.error(f"Error in processing pipeline for {audio_path}: {e}")
+            self.logger.error("Error in processing pipeline for %s: %s", audio_path, e)
             return False
     
+    def process_files_pipelined(self, paths: List[Path]) -> int:
+        """
+        Process a batch of audio files as a producer/consumer pipeline.
+
+        CPU workers preprocess files in parallel and feed a bounded queue;
+        a consumer thread runs transcription off the queue so the model
+        stays busy while the next files are still being decoded. (Whisper's
+        transcribe API is per-clip, so the consumer drains one item at a
+        time rather than stacking a batch.)
+
+        Args:
+            paths: Audio file paths to process
+
+        Returns:
+            Number of files processed successfully
+        """
+        paths = list(paths)
+        if not paths:
+            return 0
+
+        work: queue.Queue = queue.Queue(maxsize=8)
+        successes = 0
+
+        def _consume() -> None:
+            nonlocal successes
+            while True:
+                item = work.get()
+                try:
+                    if item is None:
+                        break
+                    path, samples = item
+                    if samples is None:
+                        self.logger.error("Failed to process audio file: %s", path)
+                    elif self._transcribe_and_save(path, samples):
+                        successes += 1
+                finally:
+                    work.task_done()
+
+        consumer = threading.Thread(target=_consume, name='transcribe-consumer')
+        consumer.start()
+
+        try:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = {
+                    executor.submit(_process_file_worker, self.config, path): path
+                    for path in paths
+                }
+                for future in as_completed(futures):
+                    path = futures[future]
+                    try:
+                        samples = future.result()
+                    except Exception as e:
+                        self.logger.error("Error processing audio file %s: %s", path, e)
+                        samples = None
+                    work.put((path, samples))  # blocks when the queue is full
+        finally:
+            work.put(None)
+            consumer.join()
+
+        self.logger.info("Pipeline processed %s/%s files successfully", successes, len(paths))
+        return successes
+
     def start_monitoring(self) -> bool:
         """
         Start monitoring iCloud directory for new audio files.
@@ -150,20 +319,22 @@ class AudioTranscriber:
             
             self.is_running = True
             self.logger.info("Started monitoring iCloud directory for new audio files")
-            self.logger.info(f"Source directory: {source_path}")
-            self.logger.info(f"Destination directory: {dest_path}")
+            self.logger.info("Source directory: %s", source_path)
+            self.logger.info("Destination directory: %s", dest_path)
             
             return True
             
         except Exception as e:
-            self.logger.error(f"Error starting monitoring: {e}")
+            self.logger.error("Error starting monitoring: %s", e)
             return False
     
     def stop_monitoring(self) -> None:
         """Stop monitoring for new audio files."""
-        if self.file_monitor:
+        # Only touch the monitor if it was actually created
+        if 'file_monitor' in self.__dict__:
             self.file_monitor.stop_monitoring()
         self.is_running = False
+        self._stop.set()
         self.logger.info("Stopped monitoring")
     
     def process_existing_files(self) -> int:
@@ -184,11 +355,11 @@ class AudioTranscriber:
             # Process existing files
             processed_files = self.file_monitor.process_existing_files(source_path, dest_path)
             
-            self.logger.info(f"Processed {len(processed_files)} existing audio files")
+            self.logger.info("Processed %s existing audio files", len(processed_files))
             return len(processed_files)
             
         except Exception as e:
-            self.logger.error(f"Error processing existing files: {e}")
+            self.logger.error("Error processing existing files: %s", e)
             return 0
     
     def get_status(self) -> dict:
@@ -198,26 +369,25 @@ class AudioTranscriber:
         Returns:
             Dictionary with status information
         """
+        # Report which components have been materialized without
+        # instantiating them (touching the properties would defeat the
+        # lazy init and load the model just to print status)
         status = {
             'is_running': self.is_running,
             'config_loaded': bool(self.config),
-            'components_initialized': all([
-                self.audio_processor is not None,
-                self.transcriber is not None,
-                self.file_monitor is not None,
-                self.cloud_sync is not None
-            ])
+            'components_initialized': all(
+                name in self.__dict__
+                for name in ('audio_processor', 'transcriber', 'file_monitor', 'cloud_sync')
+            )
         }
-        
-        # Add iCloud status
-        if self.cloud_sync:
-            status['icloud'] = self.cloud_sync.get_icloud_status()
-        
+
+        # Add iCloud status (cheap component, safe to materialize)
+        status['icloud'] = self.cloud_sync.get_icloud_status()
+
         # Add file statistics
-        if self.file_monitor:
-            source_path, _ = get_icloud_paths(self.config)
-            status['file_stats'] = self.file_monitor.get_file_stats(source_path)
-        
+        source_path, _ = get_icloud_paths(self.config)
+        status['file_stats'] = self.file_monitor.get_file_stats(source_path)
+
         return status
 
 
@@ -225,6 +395,7 @@ def signal_handler(signum, frame):
     """Handle interrupt signals."""
     print("\nReceived interrupt signal. Shutting down gracefully...")
     if hasattr(signal_handler, 'app') and signal_handler.app:
+        signal_handler.app._stop.set()
         signal_handler.app.stop_monitoring()
     sys.exit(0)
 
@@ -268,9 +439,9 @@ def start(config, monitor, process_existing):
             if app.start_monitoring():
                 click.echo("Monitoring started. Press Ctrl+C to stop.")
                 try:
-                    # Keep the application running
-                    while app.is_running:
-                        signal.pause()
+                    # Block until a signal handler (or stop_monitoring)
+                    # sets the stop event; costs zero CPU and is portable
+                    app._stop.wait()
                 except KeyboardInterrupt:
                     pass
                 finally:
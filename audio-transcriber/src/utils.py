@@ -2,13 +2,67 @@
 Utility functions for the Audio Transcriber package.
 """
 
+import math
 import os
 import yaml
 import logging
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Any, Optional
 import click
 
+# libyaml C loader when the binding is compiled in; pure-Python otherwise
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@dataclass(frozen=True)
+class PipelineSettings:
+    """Hot-path configuration resolved once from the YAML dict.
+
+    Components read these values per file or per event; resolving the
+    nested .get chains a single time replaces a dict chase (and a
+    throwaway default dict) per access with a plain attribute read.
+    """
+
+    output_format: str
+    supported_formats: frozenset
+    skip_existing: bool
+    debounce_seconds: float
+    recursive: bool
+    backend: str
+    poll_interval: float
+    batch_size: int
+    concurrency: int
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'PipelineSettings':
+        """Build settings from a loaded configuration dictionary."""
+        audio = config.get('audio', {})
+        monitoring = config.get('monitoring', {})
+        transcription = config.get('transcription', {})
+
+        return cls(
+            output_format=transcription.get('output_format', 'txt'),
+            supported_formats=frozenset(
+                f.lower().lstrip('.') for f in audio.get('supported_formats', [])
+            ),
+            skip_existing=monitoring.get('skip_existing', True),
+            debounce_seconds=float(monitoring.get('debounce_seconds', 1.0)),
+            recursive=monitoring.get('recursive', False),
+            backend=monitoring.get('backend', 'auto'),
+            poll_interval=float(monitoring.get('poll_interval', 60)),
+            batch_size=int(monitoring.get('batch_size', 256)),
+            concurrency=int(monitoring.get('concurrency', min(4, os.cpu_count() or 1))),
+        )
+
 
 def load_config(config_path: str = "config/settings.yaml") -> Dict[str, Any]:
     """
@@ -21,13 +75,22 @@ def load_config(config_path: str = "config/settings.yaml") -> Dict[str, Any]:
         Dictionary containing configuration settings
     """
     try:
+        # A parsed-JSON sidecar keyed by the YAML's mtime lets warm CLI
+        # runs skip YAML parsing entirely
+        mtime_ns = os.stat(config_path).st_mtime_ns
+        cache_path = Path(f"{config_path}.cache.json")
+        config = _load_config_cache(cache_path, mtime_ns)
+        if config is not None:
+            return config
+
         with open(config_path, 'r') as file:
-            config = yaml.safe_load(file)
-        
+            config = yaml.load(file, Loader=_YamlLoader)
+
         # Expand user paths
         if 'icloud' in config:
             config['icloud']['base_path'] = os.path.expanduser(config['icloud']['base_path'])
-        
+
+        _save_config_cache(cache_path, mtime_ns, config)
         return config
     except FileNotFoundError:
         click.echo(f"Configuration file not found: {config_path}")
@@ -37,6 +100,29 @@ def load_config(config_path: str = "config/settings.yaml") -> Dict[str, Any]:
         return {}
 
 
+def _load_config_cache(cache_path: Path, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """Return the cached parsed config if it matches the YAML's mtime."""
+    if orjson is None:
+        return None
+    try:
+        payload = orjson.loads(cache_path.read_bytes())
+        if payload.get('mtime_ns') == mtime_ns:
+            return payload.get('config')
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _save_config_cache(cache_path: Path, mtime_ns: int, config: Dict[str, Any]) -> None:
+    """Write the parsed config sidecar (best effort)."""
+    if orjson is None:
+        return
+    try:
+        cache_path.write_bytes(orjson.dumps({'mtime_ns': mtime_ns, 'config': config}))
+    except (OSError, TypeError):
+        pass
+
+
 def setup_logging(config: Dict[str, Any]) -> logging.Logger:
     """
     Set up logging based on configuration.
@@ -105,18 +191,26 @@ def ensure_directory_exists(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def is_audio_file(file_path: Path, supported_formats: list) -> bool:
+def is_audio_file(name: str, supported_formats: frozenset) -> bool:
     """
-    Check if a file is a supported audio file.
-    
+    Check if a filename names a supported audio file.
+
+    Operates on the plain name string (as yielded by os.scandir or
+    os.listdir) with an O(1) frozenset lookup, so directory walks pay
+    no Path construction or list scan per entry. Uses the same undotted
+    lowercase extension convention as PipelineSettings.supported_formats
+    and FileMonitor's suffix checks.
+
     Args:
-        file_path: Path to the file
-        supported_formats: List of supported file extensions
-        
+        name: Filename or path string
+        supported_formats: Frozenset of lowercase extensions without the
+            dot (e.g. frozenset({'mp3', 'wav'}))
+
     Returns:
-        True if file is a supported audio format
+        True if the name has a supported audio extension
     """
-    return file_path.suffix.lower() in supported_formats
+    stem, dot, suffix = name.rpartition('.')
+    return bool(dot) and suffix.lower() in supported_formats
 
 
 def get_transcript_filename(audio_file: Path, output_format: str = "txt") -> str:
@@ -134,21 +228,27 @@ def get_transcript_filename(audio_file: Path, output_format: str = "txt") -> str
     return f"{base_name}_transcript.{output_format}"
 
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
 def format_file_size(size_bytes: int) -> str:
     """
     Format file size in human readable format.
-    
+
+    The unit is picked in O(1) from the bit length (log2 // 10) instead
+    of dividing through each magnitude.
+
     Args:
         size_bytes: Size in bytes
-        
+
     Returns:
         Formatted size string
     """
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    if size_bytes < 1:
+        return f"{size_bytes:.1f} B"
+
+    unit = min(int(math.log2(size_bytes)) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * unit)):.1f} {_SIZE_UNITS[unit]}"
 
 
 def validate_config(config: Dict[str, Any]) -> bool: